@@ -161,3 +161,39 @@ class BashApp(AppBase):
         app_fut._outputs = out_futs
 
         return app_fut
+
+    def map(self, *iterables, **kwargs):
+        """Call the app once for each set of arguments drawn from iterables, like the builtin map.
+
+        All of the calls are added to the DataFlowKernel in one batch, which is
+        much cheaper than calling the app in a loop when there are many calls.
+
+        Args:
+             - *iterables : Iterables supplying the positional arguments of each call
+
+        Kwargs:
+             - Arbitrary, passed to every call
+
+        Returns:
+             List of App_futs, in the order of the arguments
+        """
+        # Update kwargs in the app definition with ones passed in at calltime
+        self.kwargs.update(kwargs)
+
+        if self.data_flow_kernel is None:
+            dfk = DataFlowKernelLoader.dfk()
+        else:
+            dfk = self.data_flow_kernel
+
+        arg_list = [(self.func,) + args for args in zip(*iterables)]
+        app_futs = dfk.submit_many(wrap_error(remote_side_bash_executor), arg_list,
+                                   kwargs_list=[dict(self.kwargs) for args in arg_list],
+                                   executors=self.executors,
+                                   fn_hash=self.func_hash,
+                                   cache=self.cache)
+
+        for app_fut in app_futs:
+            app_fut._outputs = [DataFuture(app_fut, o, tid=app_fut.tid)
+                                for o in kwargs.get('outputs', [])]
+
+        return app_futs
@@ -35,10 +35,22 @@ class Config(RepresentationMixin):
     lazy_errors : bool, optional
         If True, errors from task failures will not be raised until `future.result()` is called. Otherwise, they will
         be raised as soon as the task returns. Default is True.
+    nested_dependencies : bool, optional
+        If True, futures nested inside lists, tuples and dicts in app arguments are found when the app is called, and
+        the task waits for them and receives their results in their place. Otherwise only futures passed directly as
+        arguments, keyword arguments or members of `inputs` are treated as dependencies. Default is False.
     retries : int, optional
         Set the number of retries in case of failure. Default is 0.
     run_dir : str, optional
         Path to run directory. Default is 'runinfo'.
+    task_retention : int, optional
+        Number of tasks in a final state whose records are kept in the DataFlowKernel task table. Once a task
+        finishes, its function, arguments and execution future are released; once more than this many tasks have
+        finished, the oldest records are dropped and only summarised by state. If `None`, every task record is
+        kept with all of its references for the life of the DataFlowKernel. Default is None.
+    task_retention_period : str, optional
+        Time interval (in "HH:MM:SS") for which the records of finished tasks are kept in the task table. Can be used
+        instead of, or together with, `task_retention`. Default is None.
     strategy : str, optional
         Strategy to use for scaling resources according to workflow needs. Can be 'simple' or `None`. If `None`, dynamic
         scaling will be disabled. Default is 'simple'.
@@ -54,9 +66,12 @@ class Config(RepresentationMixin):
                  checkpoint_period=None,
                  data_management_max_threads=10,
                  lazy_errors=True,
+                 nested_dependencies=False,
                  retries=0,
                  run_dir='runinfo',
                  strategy='simple',
+                 task_retention=None,
+                 task_retention_period=None,
                  monitoring=None,
                  usage_tracking=False):
         if executors is None:
@@ -79,9 +94,12 @@ class Config(RepresentationMixin):
         self.checkpoint_period = checkpoint_period
         self.data_management_max_threads = data_management_max_threads
         self.lazy_errors = lazy_errors
+        self.nested_dependencies = nested_dependencies
         self.retries = retries
         self.run_dir = run_dir
         self.strategy = strategy
+        self.task_retention = task_retention
+        self.task_retention_period = task_retention_period
         self.usage_tracking = usage_tracking
         self.monitoring = monitoring
 
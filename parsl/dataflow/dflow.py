@@ -1,4 +1,5 @@
 import atexit
+import collections
 import itertools
 import logging
 import os
@@ -7,6 +8,7 @@ import pickle
 import random
 import inspect
 import threading
+import time
 import sys
 # import multiprocessing
 import datetime
@@ -27,7 +29,8 @@ from parsl.dataflow.flow_control import FlowControl, FlowNoControl, Timer
 from parsl.dataflow.futures import AppFuture
 from parsl.dataflow.memoization import Memoizer
 from parsl.dataflow.rundirs import make_rundir
-from parsl.dataflow.states import States, FINAL_STATES, FINAL_FAILURE_STATES
+from parsl.dataflow.states import States, FINAL_FAILURE_STATES
+from parsl.dataflow.taskrecord import TaskRecord
 from parsl.dataflow.usage_tracking.usage import UsageTracker
 from parsl.utils import get_version
 
@@ -146,6 +149,9 @@ class DataFlowKernel(object):
 
         data_manager = DataManager(self, max_threads=config.data_management_max_threads)
         self.executors = {}
+        # Submission to an executor is serialised by a lock for that executor only,
+        # so tasks bound for different executors can be submitted concurrently
+        self.submitter_locks = {}
         self.add_executors(config.executors + [data_manager])
 
         if self.checkpoint_mode == "periodic":
@@ -166,7 +172,22 @@ class DataFlowKernel(object):
 
         self.task_count = 0
         self.tasks = {}
-        self.submitter_lock = threading.Lock()
+
+        # Records of tasks in a final state, oldest first, and per-state counts of the
+        # records that have since been dropped from self.tasks
+        self.task_retention = config.task_retention
+        self.task_retention_period = None
+        if config.task_retention_period is not None:
+            try:
+                h, m, s = map(int, config.task_retention_period.split(':'))
+                self.task_retention_period = (h * 3600) + (m * 60) + s
+            except Exception:
+                raise ConfigurationError("invalid task_retention_period provided:{0} expected HH:MM:SS".format(
+                    config.task_retention_period))
+        self._retired_tasks = collections.deque()
+        self._retired_lock = threading.Lock()
+        self._retired_checkpoint_hashes = []
+        self.retired_task_counts = collections.Counter()
 
         atexit.register(self.atexit_cleanup)
 
@@ -178,40 +199,28 @@ class DataFlowKernel(object):
         info_to_monitor = ['func_name', 'fn_hash', 'memoize', 'checkpoint', 'fail_count',
                            'fail_history', 'status', 'id', 'time_submitted', 'time_returned', 'executor']
 
-        task_log_info = {"task_" + k: self.tasks[task_id][k] for k in info_to_monitor}
+        task = self.tasks[task_id]
+        task_log_info = {"task_" + k: getattr(task, k) for k in info_to_monitor}
         task_log_info['run_id'] = self.run_id
         task_log_info['timestamp'] = datetime.datetime.now()
-        task_log_info['task_status_name'] = self.tasks[task_id]['status'].name
+        task_log_info['task_status_name'] = task.status.name
         task_log_info['tasks_failed_count'] = self.tasks_failed_count
         task_log_info['tasks_completed_count'] = self.tasks_completed_count
-        task_log_info['task_inputs'] = str(self.tasks[task_id]['kwargs'].get('inputs', None))
-        task_log_info['task_outputs'] = str(self.tasks[task_id]['kwargs'].get('outputs', None))
-        task_log_info['task_stdin'] = self.tasks[task_id]['kwargs'].get('stdin', None)
-        task_log_info['task_stdout'] = self.tasks[task_id]['kwargs'].get('stdout', None)
+        task_log_info['task_inputs'] = str(task.kwargs.get('inputs', None))
+        task_log_info['task_outputs'] = str(task.kwargs.get('outputs', None))
+        task_log_info['task_stdin'] = task.kwargs.get('stdin', None)
+        task_log_info['task_stdout'] = task.kwargs.get('stdout', None)
         task_log_info['task_depends'] = None
-        if self.tasks[task_id]['depends'] is not None:
-            task_log_info['task_depends'] = ",".join([str(t._tid) for t in self.tasks[task_id]['depends']])
+        if task.depends is not None:
+            task_log_info['task_depends'] = ",".join([str(t._tid) for t in task.depends])
         task_log_info['task_elapsed_time'] = None
-        if self.tasks[task_id]['time_returned'] is not None:
-            task_log_info['task_elapsed_time'] = (self.tasks[task_id]['time_returned'] -
-                                                  self.tasks[task_id]['time_submitted']).total_seconds()
+        if task.time_returned is not None:
+            task_log_info['task_elapsed_time'] = (task.time_returned -
+                                                  task.time_submitted).total_seconds()
         if fail_mode is not None:
             task_log_info['task_fail_mode'] = fail_mode
         return task_log_info
 
-    def _count_deps(self, depends):
-        """Internal.
-
-        Count the number of unresolved futures in the list depends.
-        """
-        count = 0
-        for dep in depends:
-            if isinstance(dep, Future):
-                if not dep.done():
-                    count += 1
-
-        return count
-
     @property
     def config(self):
         """Returns the fully initialized config that the DFK is actively using.
@@ -250,34 +259,34 @@ class DataFlowKernel(object):
 
             # We keep the history separately, since the future itself could be
             # tossed.
-            self.tasks[task_id]['fail_history'].append(future._exception)
-            self.tasks[task_id]['fail_count'] += 1
+            self.tasks[task_id].fail_history.append(future._exception)
+            self.tasks[task_id].fail_count += 1
 
             if not self._config.lazy_errors:
                 logger.debug("Eager fail, skipping retry logic")
-                self.tasks[task_id]['status'] = States.failed
+                self.tasks[task_id].status = States.failed
                 if self.monitoring:
                     task_log_info = self._create_task_log_info(task_id, 'eager')
                     self.monitoring.send(MessageType.TASK_INFO, task_log_info)
                 return
 
-            if self.tasks[task_id]['fail_count'] <= self._config.retries:
-                self.tasks[task_id]['status'] = States.pending
+            if self.tasks[task_id].fail_count <= self._config.retries:
+                self.tasks[task_id].status = States.pending
                 logger.debug("Task {} marked for retry".format(task_id))
 
             else:
                 logger.info("Task {} failed after {} retry attempts".format(task_id,
                                                                             self._config.retries))
-                self.tasks[task_id]['status'] = States.failed
+                self.tasks[task_id].status = States.failed
                 self.tasks_failed_count += 1
-                self.tasks[task_id]['time_returned'] = datetime.datetime.now()
+                self.tasks[task_id].time_returned = datetime.datetime.now()
 
         else:
-            self.tasks[task_id]['status'] = States.done
+            self.tasks[task_id].status = States.done
             self.tasks_completed_count += 1
 
             logger.info("Task {} completed".format(task_id))
-            self.tasks[task_id]['time_returned'] = datetime.datetime.now()
+            self.tasks[task_id].time_returned = datetime.datetime.now()
 
         if self.monitoring:
             task_log_info = self._create_task_log_info(task_id, 'lazy')
@@ -285,7 +294,7 @@ class DataFlowKernel(object):
 
         # it might be that in the course of the update, we've gone back to being
         # pending - in which case, we should consider ourself for relaunch
-        if self.tasks[task_id]['status'] == States.pending:
+        if self.tasks[task_id].status == States.pending:
             self.launch_if_ready(task_id)
 
         return
@@ -307,9 +316,9 @@ class DataFlowKernel(object):
              that does not require additional memo updates.
         """
 
-        if not self.tasks[task_id]['app_fu'].done():
+        if not self.tasks[task_id].app_fu.done():
             logger.error("Internal consistency error: app_fu is not done for task {}".format(task_id))
-        if not self.tasks[task_id]['app_fu'] == future:
+        if not self.tasks[task_id].app_fu == future:
             logger.error("Internal consistency error: callback future is not the app_fu in task structure, for task {}".format(task_id))
 
         if not memo_cbk:
@@ -321,19 +330,60 @@ class DataFlowKernel(object):
                 self.checkpoint(tasks=[task_id])
 
         # Submit _*_stage_out tasks for output data futures that correspond with remote files
-        if (self.tasks[task_id]['app_fu'] and
-            self.tasks[task_id]['app_fu'].done() and
-            self.tasks[task_id]['app_fu'].exception() is None and
-            self.tasks[task_id]['executor'] != 'data_manager' and
-            self.tasks[task_id]['func_name'] != '_ftp_stage_in' and
-            self.tasks[task_id]['func_name'] != '_http_stage_in'):
-            for dfu in self.tasks[task_id]['app_fu'].outputs:
+        if (self.tasks[task_id].app_fu and
+            self.tasks[task_id].app_fu.done() and
+            self.tasks[task_id].app_fu.exception() is None and
+            self.tasks[task_id].executor != 'data_manager' and
+            self.tasks[task_id].func_name != '_ftp_stage_in' and
+            self.tasks[task_id].func_name != '_http_stage_in'):
+            for dfu in self.tasks[task_id].app_fu.outputs:
                 f = dfu.file_obj
                 if isinstance(f, File) and f.is_remote():
-                    f.stage_out(self.tasks[task_id]['executor'])
+                    f.stage_out(self.tasks[task_id].executor)
+
+        if not memo_cbk and self._retention_enabled:
+            self._retire_task(task_id)
 
         return
 
+    @property
+    def _retention_enabled(self):
+        return self.task_retention is not None or self.task_retention_period is not None
+
+    def _retire_task(self, task_id):
+        """Release the references held by a task that has reached its final state.
+
+        The function, arguments and execution future are dropped straight away. The
+        rest of the record is kept until more than `task_retention` tasks have finished
+        after it, or until it is older than `task_retention_period`, and is then removed
+        from the task table. Removed tasks are only remembered as a count per state, plus
+        their hash if they still need to be checkpointed.
+        """
+        task = self.tasks[task_id]
+        task.func = None
+        task.args = None
+        task.kwargs = None
+        task.depends = None
+        task.dep_index = None
+        task.exec_fu = None
+        task.task_launch_lock = None
+
+        now = time.time()
+        with self._retired_lock:
+            self._retired_tasks.append((task_id, now))
+            while self._retired_tasks:
+                oldest_id, retired_at = self._retired_tasks[0]
+                over_count = self.task_retention is not None and len(self._retired_tasks) > self.task_retention
+                expired = self.task_retention_period is not None and now - retired_at > self.task_retention_period
+                if not (over_count or expired):
+                    break
+                self._retired_tasks.popleft()
+                old_task = self.tasks.pop(oldest_id)
+                self.retired_task_counts[old_task.status] += 1
+                if (self.checkpoint_mode is not None and old_task.hashsum and
+                    not old_task.checkpoint and old_task.status == States.done):
+                    self._retired_checkpoint_hashes.append(old_task.hashsum)
+
     def launch_if_ready(self, task_id):
         """
         launch_if_ready will launch the specified task, if it is ready
@@ -349,28 +399,34 @@ class DataFlowKernel(object):
         launch_if_ready is thread safe, so may be called from any thread
         or callback.
         """
-        if self._count_deps(self.tasks[task_id]['depends']) == 0:
+        task = self.tasks.get(task_id)
+        if task is None or task.status != States.pending:
+            # Not waiting to be launched, or already finished and retired
+            return
+
+        func, args, kwargs = task.func, task.args, task.kwargs
+        launch_lock = task.task_launch_lock
+        if launch_lock is None or func is None:
+            return
+
+        if task.outstanding_deps == 0:
 
             # We can now launch *task*
-            new_args, kwargs, exceptions = self.sanitize_and_wrap(task_id,
-                                                                  self.tasks[task_id]['args'],
-                                                                  self.tasks[task_id]['kwargs'])
-            self.tasks[task_id]['args'] = new_args
-            self.tasks[task_id]['kwargs'] = kwargs
+            new_args, kwargs, exceptions = self.sanitize_and_wrap(task_id, args, kwargs)
             if not exceptions:
                 # There are no dependency errors
                 exec_fu = None
                 # Acquire a lock, retest the state, launch
-                with self.tasks[task_id]['task_launch_lock']:
-                    if self.tasks[task_id]['status'] == States.pending:
-                        exec_fu = self.launch_task(
-                            task_id, self.tasks[task_id]['func'], *new_args, **kwargs)
+                with launch_lock:
+                    if task.status == States.pending:
+                        task.args = new_args
+                        task.kwargs = kwargs
+                        exec_fu = self.launch_task(task_id, func, *new_args, **kwargs)
 
                 if exec_fu:
-                    self.tasks[task_id]['exec_fu'] = exec_fu
+                    task.exec_fu = exec_fu
                     try:
-                        self.tasks[task_id]['app_fu'].update_parent(exec_fu)
-                        self.tasks[task_id]['exec_fu'] = exec_fu
+                        task.app_fu.update_parent(exec_fu)
                     except AttributeError as e:
                         logger.error(
                             "Task {}: Caught AttributeError at update_parent".format(task_id))
@@ -379,7 +435,7 @@ class DataFlowKernel(object):
                 logger.info(
                     "Task {} failed due to dependency failure".format(task_id))
                 # Raise a dependency exception
-                self.tasks[task_id]['status'] = States.dep_fail
+                task.status = States.dep_fail
                 if self.monitoring is not None:
                     task_log_info = self._create_task_log_info(task_id, 'lazy')
                     self.monitoring.send(MessageType.TASK_INFO, task_log_info)
@@ -387,8 +443,8 @@ class DataFlowKernel(object):
                 try:
                     fu = Future()
                     fu.retries_left = 0
-                    self.tasks[task_id]['exec_fu'] = fu
-                    self.tasks[task_id]['app_fu'].update_parent(fu)
+                    task.exec_fu = fu
+                    task.app_fu.update_parent(fu)
                     fu.set_exception(DependencyError(exceptions,
                                                      task_id,
                                                      None))
@@ -419,7 +475,24 @@ class DataFlowKernel(object):
         Returns:
             Future that tracks the execution of the submitted executable
         """
-        self.tasks[task_id]['time_submitted'] = datetime.datetime.now()
+        memo_fu = self._check_memo_hit(task_id)
+        if memo_fu is not None:
+            return memo_fu
+
+        executor, executable = self._prepare_executable(task_id, executable)
+
+        with self.submitter_locks[executor.label]:
+            exec_fu = executor.submit(executable, *args, **kwargs)
+        self._task_launched(task_id, executor, exec_fu)
+        return exec_fu
+
+    def _check_memo_hit(self, task_id):
+        """Stamp the submission time of a task about to launch and look up its result in the memoizer.
+
+        On a hit, the task is completed from the cached result and the memo future
+        is returned. Otherwise returns None.
+        """
+        self.tasks[task_id].time_submitted = datetime.datetime.now()
 
         hit, memo_fu = self.memoizer.check_memo(task_id, self.tasks[task_id])
         if hit:
@@ -433,8 +506,15 @@ class DataFlowKernel(object):
             except Exception as e:
                 logger.error("handle_app_update raised an exception {} which will be ignored".format(e))
             return memo_fu
+        return None
+
+    def _prepare_executable(self, task_id, executable):
+        """Find the executor a task was assigned to, and wrap its executable for monitoring if enabled.
 
-        executor_label = self.tasks[task_id]["executor"]
+        Returns:
+            (executor, executable)
+        """
+        executor_label = self.tasks[task_id].executor
         try:
             executor = self.executors[executor_label]
         except Exception:
@@ -445,22 +525,22 @@ class DataFlowKernel(object):
                                                          self.monitoring.monitoring_hub_url,
                                                          self.run_id,
                                                          self.monitoring.resource_monitoring_interval)
+        return executor, executable
 
-        with self.submitter_lock:
-            exec_fu = executor.submit(executable, *args, **kwargs)
-        self.tasks[task_id]['status'] = States.launched
+    def _task_launched(self, task_id, executor, exec_fu):
+        """Record that a task has been handed to an executor, and attach the execution callback."""
+        self.tasks[task_id].status = States.launched
         if self.monitoring is not None:
             task_log_info = self._create_task_log_info(task_id, 'lazy')
             self.monitoring.send(MessageType.TASK_INFO, task_log_info)
 
         exec_fu.retries_left = self._config.retries - \
-            self.tasks[task_id]['fail_count']
+            self.tasks[task_id].fail_count
         logger.info("Task {} launched on executor {}".format(task_id, executor.label))
         try:
             exec_fu.add_done_callback(partial(self.handle_exec_update, task_id))
         except Exception as e:
             logger.error("add_done_callback got an exception {} which will be ignored".format(e))
-        return exec_fu
 
     def _add_input_deps(self, executor, args, kwargs):
         """Look for inputs of the app that are remote files. Submit stage_in
@@ -509,7 +589,7 @@ class DataFlowKernel(object):
         count = 0
         for dep in args:
             if isinstance(dep, Future):
-                if self.tasks[dep.tid]['status'] not in FINAL_STATES:
+                if not dep.done():
                     count += 1
                 depends.extend([dep])
 
@@ -517,24 +597,114 @@ class DataFlowKernel(object):
         for key in kwargs:
             dep = kwargs[key]
             if isinstance(dep, Future):
-                if self.tasks[dep.tid]['status'] not in FINAL_STATES:
+                if not dep.done():
                     count += 1
                 depends.extend([dep])
 
         # Check for futures in inputs=[<fut>...]
         for dep in kwargs.get('inputs', []):
             if isinstance(dep, Future):
-                if self.tasks[dep.tid]['status'] not in FINAL_STATES:
+                if not dep.done():
                     count += 1
                 depends.extend([dep])
 
         return count, depends
 
+    def _gather_nested_deps(self, args, kwargs):
+        """Find the futures on which a task depends, including those nested in lists, tuples and dicts.
+
+        The positions of the futures are recorded in an index, so that their results
+        can be substituted at launch without walking the arguments again. An index
+        maps each key of a container that leads to a future either to the position of
+        that future in the list of dependencies, or to the index of the nested container.
+
+        Args:
+            - args (List[args]) : The list of args list to the fn
+            - kwargs (Dict{kwargs}) : The dict of all kwargs passed to the fn
+
+        Returns:
+            - [list of dependencies], (args index, kwargs index) or None if there are no dependencies
+
+        """
+        depends = []
+
+        def scan(obj):
+            if isinstance(obj, Future):
+                depends.append(obj)
+                return len(depends) - 1
+            elif type(obj) in (list, tuple):
+                items = enumerate(obj)
+            elif type(obj) is dict:
+                items = obj.items()
+            else:
+                return None
+
+            index = {}
+            for key, item in items:
+                sub_index = scan(item)
+                if sub_index is not None:
+                    index[key] = sub_index
+            return index or None
+
+        dep_index = (scan(args), scan(kwargs))
+        if not depends:
+            dep_index = None
+        return depends, dep_index
+
+    def _substitute_nested_deps(self, task_id, args, kwargs, dep_index):
+        """Replace the futures recorded by _gather_nested_deps with their results.
+
+        Only the containers on the path to a future are copied, so the arguments
+        the app was called with are left unchanged.
+
+        Return:
+             new_args, new_kwargs, dep_failures
+        """
+        dep_failures = []
+        results = []
+        for dep in self.tasks[task_id].depends:
+            try:
+                results.append(dep.result())
+            except Exception as e:
+                if self._dep_failed(dep):
+                    dep_failures.extend([e])
+                results.append(dep)
+
+        def substitute(obj, index):
+            if isinstance(index, int):
+                return results[index]
+
+            if type(obj) is dict:
+                new_obj = dict(obj)
+            else:
+                new_obj = list(obj)
+            for key, sub_index in index.items():
+                new_obj[key] = substitute(obj[key], sub_index)
+
+            if type(obj) is tuple:
+                return tuple(new_obj)
+            return new_obj
+
+        args_index, kwargs_index = dep_index
+        new_args = list(args) if args_index is None else substitute(list(args), args_index)
+        new_kwargs = kwargs if kwargs_index is None else substitute(kwargs, kwargs_index)
+        return new_args, new_kwargs, dep_failures
+
+    def _dep_failed(self, dep):
+        """Check whether the task behind a dependency future has failed.
+
+        A task whose record has already been dropped from the task table finished
+        a while ago, so a dependency which raised from such a task has failed.
+        """
+        task = self.tasks.get(dep.tid)
+        return task is None or task.status in FINAL_FAILURE_STATES
+
     def sanitize_and_wrap(self, task_id, args, kwargs):
         """This function should be called **ONLY** when all the futures we track have been resolved.
 
         If the user hid futures a level below, we will not catch
-        it, and will (most likely) result in a type error.
+        it, and will (most likely) result in a type error, unless
+        the config enables nested_dependencies.
 
         Args:
              task_id (uuid str) : Task id
@@ -546,6 +716,10 @@ class DataFlowKernel(object):
              partial function evaluated with all dependencies in  args, kwargs and kwargs['inputs'] evaluated.
 
         """
+        dep_index = self.tasks[task_id].dep_index
+        if dep_index is not None:
+            return self._substitute_nested_deps(task_id, args, kwargs, dep_index)
+
         dep_failures = []
 
         # Replace item in args
@@ -555,7 +729,7 @@ class DataFlowKernel(object):
                 try:
                     new_args.extend([dep.result()])
                 except Exception as e:
-                    if self.tasks[dep.tid]['status'] in FINAL_FAILURE_STATES:
+                    if self._dep_failed(dep):
                         dep_failures.extend([e])
             else:
                 new_args.extend([dep])
@@ -567,7 +741,7 @@ class DataFlowKernel(object):
                 try:
                     kwargs[key] = dep.result()
                 except Exception as e:
-                    if self.tasks[dep.tid]['status'] in FINAL_FAILURE_STATES:
+                    if self._dep_failed(dep):
                         dep_failures.extend([e])
 
         # Check for futures in inputs=[<fut>...]
@@ -578,7 +752,7 @@ class DataFlowKernel(object):
                     try:
                         new_inputs.extend([dep.result()])
                     except Exception as e:
-                        if self.tasks[dep.tid]['status'] in FINAL_FAILURE_STATES:
+                        if self._dep_failed(dep):
                             dep_failures.extend([e])
 
                 else:
@@ -622,34 +796,91 @@ class DataFlowKernel(object):
 
         task_id = self.task_count
         self.task_count += 1
+        executor = random.choice(self._executor_choices(executors))
+
+        task_def = self._create_task(task_id, func, args, kwargs, executor, fn_hash, cache)
+        self._launch_when_ready(task_id)
+
+        return task_def.app_fu
+
+    def submit_many(self, func, arg_list, kwargs_list=None, executors='all', fn_hash=None, cache=False):
+        """Add many tasks for the same function to the dataflow system in one call.
+
+        This behaves like calling :meth:`submit` once for each entry of `arg_list`,
+        but task ids, task records and AppFutures are created in a single pass, and
+        the tasks which are ready to run straight away are handed to each executor
+        with a single :meth:`~parsl.executors.base.ParslExecutor.submit_batch` call.
+        Tasks that depend on unresolved futures are launched as their dependencies
+        complete, as with :meth:`submit`.
+
+        Args:
+            - func : A function object
+            - arg_list (iterable of tuples) : Positional args for each task
+
+        KWargs :
+            - kwargs_list (iterable of dicts) : Kwargs for each task, matching arg_list.
+                    Default=None, which calls every task with no kwargs
+            - executors (list or string) : List of executors these calls could go to.
+                    Default='all'
+            - fn_hash (Str) : Hash of the function
+                    Default=None
+            - cache (Bool) : To enable memoization or not
+
+        Returns:
+               list of AppFutures, in the same order as arg_list
+        """
+
+        if self.cleanup_called:
+            raise ValueError("Cannot submit to a DFK that has been cleaned up")
+
+        arg_list = [tuple(args) for args in arg_list]
+        if kwargs_list is None:
+            kwargs_list = [{} for args in arg_list]
+        else:
+            kwargs_list = list(kwargs_list)
+            if len(kwargs_list) != len(arg_list):
+                raise ValueError("submit_many expects as many kwargs as args: got {} kwargs for {} args".format(
+                    len(kwargs_list), len(arg_list)))
+
+        choices = self._executor_choices(executors)
+        first_id = self.task_count
+        self.task_count += len(arg_list)
+
+        app_futs = []
+        ready = []
+        for i, (args, kwargs) in enumerate(zip(arg_list, kwargs_list)):
+            task_id = first_id + i
+            task_def = self._create_task(task_id, func, args, kwargs, random.choice(choices), fn_hash, cache)
+            app_futs.append(task_def.app_fu)
+
+            if all(d.done() and d.exception() is None for d in task_def.depends):
+                task_def.outstanding_deps = 0
+                ready.append(task_id)
+            else:
+                self._launch_when_ready(task_id)
+
+        self._launch_batch(ready)
+
+        return app_futs
+
+    def _executor_choices(self, executors):
         if isinstance(executors, str) and executors.lower() == 'all':
             choices = list(e for e in self.executors if e != 'data_manager')
         elif isinstance(executors, list):
             choices = executors
-        executor = random.choice(choices)
+        return choices
+
+    def _create_task(self, task_id, func, args, kwargs, executor, fn_hash, cache):
+        """Create the task record and AppFuture for a new task, and move it to the pending state.
 
+        Returns:
+            TaskRecord
+        """
         # Transform remote input files to data futures
         args, kwargs = self._add_input_deps(executor, args, kwargs)
 
-        task_def = {'depends': None,
-                    'executor': executor,
-                    'func': func,
-                    'func_name': func.__name__,
-                    'args': args,
-                    'kwargs': kwargs,
-                    'fn_hash': fn_hash,
-                    'memoize': cache,
-                    'callback': None,
-                    'exec_fu': None,
-                    'checkpoint': None,
-                    'fail_count': 0,
-                    'fail_history': [],
-                    'env': None,
-                    'status': States.unsched,
-                    'id': task_id,
-                    'time_submitted': None,
-                    'time_returned': None,
-                    'app_fu': None}
+        task_def = TaskRecord(task_id, func, args, kwargs, executor,
+                              fn_hash=fn_hash, memoize=cache)
 
         if task_id in self.tasks:
             raise DuplicateTaskError(
@@ -657,53 +888,111 @@ class DataFlowKernel(object):
         else:
             self.tasks[task_id] = task_def
 
-        # Get the dep count and a list of dependencies for the task
-        dep_cnt, depends = self._gather_all_deps(args, kwargs)
-        self.tasks[task_id]['depends'] = depends
+        # Get a list of dependencies for the task
+        if self._config.nested_dependencies:
+            depends, task_def.dep_index = self._gather_nested_deps(args, kwargs)
+        else:
+            dep_cnt, depends = self._gather_all_deps(args, kwargs)
+        task_def.depends = depends
+        task_def.outstanding_deps = len(depends)
 
         # Extract stdout and stderr to pass to AppFuture:
         task_stdout = kwargs.get('stdout')
         task_stderr = kwargs.get('stderr')
 
         logger.info("Task {} submitted for App {}, waiting on tasks {}".format(task_id,
-                                                                               task_def['func_name'],
+                                                                               task_def.func_name,
                                                                                [fu.tid for fu in depends]))
 
-        self.tasks[task_id]['task_launch_lock'] = threading.Lock()
+        task_def.task_launch_lock = threading.Lock()
         app_fu = AppFuture(tid=task_id,
                            stdout=task_stdout,
                            stderr=task_stderr)
 
-        self.tasks[task_id]['app_fu'] = app_fu
+        task_def.app_fu = app_fu
         app_fu.add_done_callback(partial(self.handle_app_update, task_id))
-        self.tasks[task_id]['status'] = States.pending
-        logger.debug("Task {} set to pending state with AppFuture: {}".format(task_id, task_def['app_fu']))
-
-        # at this point add callbacks to all dependencies to do a launch_if_ready
-        # call whenever a dependency completes.
-
-        # we need to be careful about the order of setting the state to pending,
-        # adding the callbacks, and caling launch_if_ready explicitly once always below.
-
-        # I think as long as we call launch_if_ready once after setting pending, then
-        # we can add the callback dependencies at any point: if the callbacks all fire
-        # before then, they won't cause a launch, but the one below will. if they fire
-        # after we set it pending, then the last one will cause a launch, and the
-        # explicit one won't.
-
-        for d in depends:
-
-            def callback_adapter(dep_fut):
-                self.launch_if_ready(task_id)
+        task_def.status = States.pending
+        logger.debug("Task {} set to pending state with AppFuture: {}".format(task_id, task_def.app_fu))
+        return task_def
+
+    def _launch_when_ready(self, task_id):
+        """Launch a task now if it has no dependencies, otherwise once the last of them completes.
+
+        The task's count of outstanding dependencies starts at the total number of
+        dependencies, including any which have already completed, and each dependency
+        gets a callback which counts it off. Callbacks added to completed futures run
+        straight away, so exactly one callback takes the count to zero and launches
+        the task, and the work done per dependency is constant however many the task has.
+        """
+        task = self.tasks[task_id]
+        if not task.depends:
+            self.launch_if_ready(task_id)
+            return
 
+        callback = partial(self._dependency_done, task_id)
+        for d in task.depends:
             try:
-                d.add_done_callback(callback_adapter)
+                d.add_done_callback(callback)
             except Exception as e:
                 logger.error("add_done_callback got an exception {} which will be ignored".format(e))
+                self._dependency_done(task_id, d)
 
-        self.launch_if_ready(task_id)
+    def _dependency_done(self, task_id, dep_fut):
+        """Count off a completed dependency, and launch the task if it was the last one.
+        """
+        task = self.tasks.get(task_id)
+        launch_lock = task.task_launch_lock if task is not None else None
+        if launch_lock is None:
+            return
 
-        return task_def['app_fu']
+        with launch_lock:
+            task.outstanding_deps -= 1
+            ready = task.outstanding_deps == 0
+
+        if ready:
+            self.launch_if_ready(task_id)
+
+    def _launch_batch(self, task_ids):
+        """Launch tasks whose dependencies have all completed successfully.
+
+        Memoized results are used where available. The remaining tasks are grouped
+        by executor and each group is passed to the executor in one submit_batch call.
+        """
+        batches = {}
+        for task_id in task_ids:
+            task = self.tasks[task_id]
+            # Callers only pass tasks whose dependencies all succeeded, so there
+            # are no dependency failures to handle here
+            new_args, kwargs, _ = self.sanitize_and_wrap(task_id, task.args, task.kwargs)
+
+            memo_fu = None
+            with task.task_launch_lock:
+                if task.status != States.pending:
+                    continue
+                task.args = new_args
+                task.kwargs = kwargs
+                memo_fu = self._check_memo_hit(task_id)
+                if memo_fu is None:
+                    # Not pending any more, so that nothing else launches the task
+                    # before its batch is submitted
+                    task.status = States.runnable
+                    executor, executable = self._prepare_executable(task_id, task.func)
+                    if executor.label not in batches:
+                        batches[executor.label] = (executor, [])
+                    batches[executor.label][1].append((task_id, executable, new_args, kwargs))
+
+            if memo_fu is not None:
+                task.exec_fu = memo_fu
+                task.app_fu.update_parent(memo_fu)
+
+        for executor, items in batches.values():
+            with self.submitter_locks[executor.label]:
+                exec_futs = executor.submit_batch([(executable, args, kwargs) for _, executable, args, kwargs in items])
+            for (task_id, _, _, _), exec_fu in zip(items, exec_futs):
+                task = self.tasks[task_id]
+                self._task_launched(task_id, executor, exec_fu)
+                task.exec_fu = exec_fu
+                task.app_fu.update_parent(exec_fu)
 
     # it might also be interesting to assert that all DFK
     # tasks are in a "final" state (3,4,5) when the DFK
@@ -718,8 +1007,9 @@ class DataFlowKernel(object):
         total_summarised = 0
 
         keytasks = []
-        for tid in self.tasks:
-            keytasks.append((self.tasks[tid]['status'], tid))
+        tasks = list(self.tasks.items())
+        for tid, task in tasks:
+            keytasks.append((task.status, tid))
 
         def first(t):
             return t[0]
@@ -746,11 +1036,14 @@ class DataFlowKernel(object):
 
             logger.info("Tasks in state {}: {}".format(str(k), tids_string))
 
-        total_in_tasks = len(self.tasks)
+        total_in_tasks = len(tasks)
         if total_summarised != total_in_tasks:
             logger.error("Task count summarisation was inconsistent: summarised {} tasks, but tasks list contains {} tasks".format(
                 total_summarised, total_in_tasks))
 
+        for k in sorted(self.retired_task_counts):
+            logger.info("Retired tasks in state {}: {}".format(str(k), self.retired_task_counts[k]))
+
         logger.info("End of summary")
 
     def add_executors(self, executors):
@@ -768,6 +1061,7 @@ class DataFlowKernel(object):
                             executor.provider.script_dir = os.path.join(self.run_dir, 'local_submit_scripts')
                     executor.provider.channel.makedirs(executor.provider.channel.script_dir, exist_ok=True)
                     os.makedirs(executor.provider.script_dir, exist_ok=True)
+            self.submitter_locks[executor.label] = threading.Lock()
             self.executors[executor.label] = executor
             executor.start()
         if hasattr(self, 'flowcontrol') and isinstance(self.flowcontrol, FlowControl):
@@ -784,10 +1078,10 @@ class DataFlowKernel(object):
         """
 
         logger.info("Waiting for all remaining tasks to complete")
-        for task_id in self.tasks:
+        for task_id, task in list(self.tasks.items()):
             # .exception() is a less exception throwing way of
             # waiting for completion than .result()
-            fut = self.tasks[task_id]['app_fu']
+            fut = task.app_fu
             if not fut.done():
                 logger.debug("Waiting for task {} to complete".format(task_id))
                 fut.exception()
@@ -883,7 +1177,7 @@ class DataFlowKernel(object):
             if tasks:
                 checkpoint_queue = tasks
             else:
-                checkpoint_queue = self.tasks
+                checkpoint_queue = list(self.tasks)
 
             checkpoint_dir = '{0}/checkpoint'.format(self.run_dir)
             checkpoint_dfk = checkpoint_dir + '/dfk.pkl'
@@ -903,34 +1197,48 @@ class DataFlowKernel(object):
 
             count = 0
 
+            def write_entry(f, hashsum):
+                t = {'hash': hashsum,
+                     'exception': None,
+                     'result': None}
+                try:
+                    # Asking for the result will raise an exception if
+                    # the app had failed. Should we even checkpoint these?
+                    # TODO : Resolve this question ?
+                    r = self.memoizer.hash_lookup(hashsum).result()
+                except Exception as e:
+                    t['exception'] = e
+                else:
+                    t['result'] = r
+
+                # We are using pickle here since pickle dumps to a file in 'ab'
+                # mode behave like a incremental log.
+                pickle.dump(t, f)
+
             with open(checkpoint_tasks, 'ab') as f:
                 for task_id in checkpoint_queue:
-                    if not self.tasks[task_id]['checkpoint'] and \
-                       self.tasks[task_id]['app_fu'].done() and \
-                       self.tasks[task_id]['app_fu'].exception() is None:
-                        hashsum = self.tasks[task_id]['hashsum']
+                    task = self.tasks.get(task_id)
+                    if task is None:
+                        continue
+                    if not task.checkpoint and \
+                       task.app_fu.done() and \
+                       task.app_fu.exception() is None:
+                        hashsum = task.hashsum
                         if not hashsum:
                             continue
-                        t = {'hash': hashsum,
-                             'exception': None,
-                             'result': None}
-                        try:
-                            # Asking for the result will raise an exception if
-                            # the app had failed. Should we even checkpoint these?
-                            # TODO : Resolve this question ?
-                            r = self.memoizer.hash_lookup(hashsum).result()
-                        except Exception as e:
-                            t['exception'] = e
-                        else:
-                            t['result'] = r
-
-                        # We are using pickle here since pickle dumps to a file in 'ab'
-                        # mode behave like a incremental log.
-                        pickle.dump(t, f)
+                        write_entry(f, hashsum)
                         count += 1
-                        self.tasks[task_id]['checkpoint'] = True
+                        task.checkpoint = True
                         logger.debug("Task {} checkpointed".format(task_id))
 
+                # Tasks which were dropped from the task table before being checkpointed
+                with self._retired_lock:
+                    retired_hashes = self._retired_checkpoint_hashes
+                    self._retired_checkpoint_hashes = []
+                for hashsum in retired_hashes:
+                    write_entry(f, hashsum)
+                    count += 1
+
             self.checkpointed_tasks += count
 
             if count == 0:
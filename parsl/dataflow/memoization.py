@@ -63,17 +63,17 @@ class Memoizer(object):
         at serialization.
 
         Args:
-            - task (dict) : Task dictionary from dfk.tasks
+            - task (TaskRecord) : Task record from dfk.tasks
 
         Returns:
             - hash (str) : A unique hash string
         """
         # Function name TODO: Add fn body later
-        t = [serialize_object(task['func_name'])[0],
-             serialize_object(task['fn_hash'])[0],
-             serialize_object(task['args'])[0],
-             serialize_object(task['kwargs'])[0],
-             serialize_object(task['env'])[0]]
+        t = [serialize_object(task.func_name)[0],
+             serialize_object(task.fn_hash)[0],
+             serialize_object(task.args)[0],
+             serialize_object(task.kwargs)[0],
+             serialize_object(task.env)[0]]
         x = b''.join(t)
         hashedsum = hashlib.md5(x).hexdigest()
         return hashedsum
@@ -86,17 +86,17 @@ class Memoizer(object):
         This seems like a reasonable option without relying on an cache_miss exception.
 
         Args:
-            - task(task) : task from the dfk.tasks table
+            - task (TaskRecord) : task from the dfk.tasks table
 
         Returns:
             Tuple of the following:
             - present (Bool): Is this present in the memo_lookup_table
             - Result (Py Obj): Result of the function if present in table
 
-        This call will also set task['hashsum'] to the unique hashsum for the func+inputs.
+        This call will also set task.hashsum to the unique hashsum for the func+inputs.
         """
-        if not self.memoize or not task['memoize']:
-            task['hashsum'] = None
+        if not self.memoize or not task.memoize:
+            task.hashsum = None
             return None, None
 
         hashsum = self.make_hash(task)
@@ -107,7 +107,7 @@ class Memoizer(object):
             result = self.memo_lookup_table[hashsum]
             logger.info("Task %s using result from cache", task_id)
 
-        task['hashsum'] = hashsum
+        task.hashsum = hashsum
         return present, result
 
     def hash_lookup(self, hashsum):
@@ -132,18 +132,18 @@ class Memoizer(object):
 
         Args:
              - task_id (int): Integer task id
-             - task (dict) : A task dict from dfk.tasks
+             - task (TaskRecord) : A task record from dfk.tasks
              - r (Result future): Result future
 
         A warning is issued when a hash collision occurs during the update.
         This is not likely.
         """
-        if not self.memoize or not task['memoize']:
+        if not self.memoize or not task.memoize:
             return
 
-        if task['hashsum'] in self.memo_lookup_table:
+        if task.hashsum in self.memo_lookup_table:
             logger.info('Updating appCache entry with latest %s:%s call' %
-                        (task['func_name'], task_id))
-            self.memo_lookup_table[task['hashsum']] = r
+                        (task.func_name, task_id))
+            self.memo_lookup_table[task.hashsum] = r
         else:
-            self.memo_lookup_table[task['hashsum']] = r
+            self.memo_lookup_table[task.hashsum] = r
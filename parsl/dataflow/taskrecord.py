@@ -0,0 +1,84 @@
+"""This module implements the TaskRecord which the DataFlowKernel keeps for every task.
+
+A DataFlowKernel can hold millions of task records over the life of a workflow,
+so the record is a slotted class rather than a dict: it has no per-instance
+``__dict__`` and attribute access avoids a hash lookup on every field.
+"""
+from parsl.dataflow.states import States
+
+
+class TaskRecord(object):
+    """Bookkeeping for a single task in :attr:`parsl.dataflow.dflow.DataFlowKernel.tasks`.
+
+    Fields are read and written as attributes, eg. ``task.status``. Item access
+    (``task['status']``) is also supported so that code written against the
+    older dict based task table continues to work.
+    """
+
+    __slots__ = ('id',
+                 'func',
+                 'func_name',
+                 'fn_hash',
+                 'args',
+                 'kwargs',
+                 'executor',
+                 'env',
+                 'memoize',
+                 'hashsum',
+                 'checkpoint',
+                 'depends',
+                 'outstanding_deps',
+                 'dep_index',
+                 'status',
+                 'exec_fu',
+                 'app_fu',
+                 'fail_count',
+                 'fail_history',
+                 'time_submitted',
+                 'time_returned',
+                 'task_launch_lock')
+
+    def __init__(self, task_id, func, args, kwargs, executor, fn_hash=None, memoize=False):
+        self.id = task_id
+        self.func = func
+        self.func_name = func.__name__
+        self.fn_hash = fn_hash
+        self.args = args
+        self.kwargs = kwargs
+        self.executor = executor
+        self.env = None
+        self.memoize = memoize
+        self.hashsum = None
+        self.checkpoint = None
+        self.depends = None
+        self.outstanding_deps = 0
+        self.dep_index = None
+        self.status = States.unsched
+        self.exec_fu = None
+        self.app_fu = None
+        self.fail_count = 0
+        self.fail_history = []
+        self.time_submitted = None
+        self.time_returned = None
+        self.task_launch_lock = None
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __repr__(self):
+        return "<TaskRecord {} func={} status={}>".format(self.id, self.func_name, self.status.name)
@@ -185,8 +185,9 @@ class UsageTracker (object):
 
         site_count = len([x for x in self.dfk.config.executors if x.managed])
 
-        app_fails = len([t for t in self.dfk.tasks if
-                         self.dfk.tasks[t]['status'] in FINAL_FAILURE_STATES])
+        app_fails = len([t for t in list(self.dfk.tasks.values()) if
+                         t.status in FINAL_FAILURE_STATES])
+        app_fails += sum(self.dfk.retired_task_counts[s] for s in FINAL_FAILURE_STATES)
 
         message = {'uuid': self.uuid,
                    'end': time.time(),
@@ -33,6 +33,20 @@ class ParslExecutor(metaclass=ABCMeta):
         """
         pass
 
+    def submit_batch(self, tasks):
+        """Submit many tasks at once.
+
+        Executors which can hand work to their workers more cheaply in bulk
+        should override this. The default submits each task in turn.
+
+        Args:
+            - tasks (list of (func, args, kwargs) tuples) : The tasks to submit
+
+        Returns:
+            list of Futures, one for each task in the same order
+        """
+        return [self.submit(func, *args, **kwargs) for func, args, kwargs in tasks]
+
     @abstractmethod
     def scale_out(self, *args, **kwargs):
         """Scale out method.
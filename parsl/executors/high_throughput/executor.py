@@ -24,6 +24,7 @@ logger = logging.getLogger(__name__)
 
 BUFFER_THRESHOLD = 1024 * 1024
 ITEM_THRESHOLD = 1024
+SUBMIT_BATCH_SIZE = 1024
 
 
 class HighThroughputExecutor(ParslExecutor, RepresentationMixin):
@@ -466,6 +467,48 @@ class HighThroughputExecutor(ParslExecutor, RepresentationMixin):
         # Return the future
         return self.tasks[task_id]
 
+    def submit_batch(self, tasks):
+        """Submits many tasks to the outgoing_q.
+
+        Tasks are packed as in :meth:`submit`, but are sent to the interchange
+        as lists of up to SUBMIT_BATCH_SIZE tasks per message rather than one
+        message per task.
+
+        Args:
+            - tasks (list of (func, args, kwargs) tuples) : The tasks to submit
+
+        Returns:
+              list of Futures, one for each task in the same order
+        """
+        if self._executor_bad_state.is_set():
+            raise self._executor_exception
+
+        logger.debug("Pushing batch of {} tasks to queue".format(len(tasks)))
+
+        futures = []
+        msgs = []
+        for func, args, kwargs in tasks:
+            self._task_counter += 1
+            task_id = self._task_counter
+
+            self.tasks[task_id] = Future()
+            futures.append(self.tasks[task_id])
+
+            fn_buf = pack_apply_message(func, args, kwargs,
+                                        buffer_threshold=1024 * 1024,
+                                        item_threshold=1024)
+            msgs.append({"task_id": task_id,
+                         "buffer": fn_buf})
+
+            if len(msgs) >= SUBMIT_BATCH_SIZE:
+                self.outgoing_q.put(msgs)
+                msgs = []
+
+        if msgs:
+            self.outgoing_q.put(msgs)
+
+        return futures
+
     @property
     def scaling_enabled(self):
         return self._scaling_enabled
@@ -238,6 +238,12 @@ class Interchange(object):
             if msg == 'STOP':
                 kill_event.set()
                 break
+            elif isinstance(msg, list):
+                # A batch of tasks from HighThroughputExecutor.submit_batch
+                for task in msg:
+                    self.pending_task_queue.put(task)
+                task_counter += len(msg)
+                logger.debug("[TASK_PULL_THREAD] Fetched batch of {} tasks:{}".format(len(msg), task_counter))
             else:
                 self.pending_task_queue.put(msg)
                 task_counter += 1
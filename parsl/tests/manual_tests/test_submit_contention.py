@@ -0,0 +1,97 @@
+"""Benchmark contention on the DFK launch path with several executors.
+
+A root task on each executor fans out to many children on the same executor,
+so when the roots complete, dependency callbacks launch children from several
+executor threads at once. Each executor simulates a submit cost (serialising
+the task and pushing it to a socket) with a sleep, which releases the GIL as
+socket sends do.
+
+Run with --global-lock to share one submit lock across all executors, which
+reproduces the old behaviour of a single DFK wide submitter lock.
+"""
+import argparse
+import threading
+import time
+
+import parsl
+from parsl.app.app import python_app
+from parsl.config import Config
+from parsl.executors.threads import ThreadPoolExecutor
+
+
+class SlowSubmitExecutor(ThreadPoolExecutor):
+    """A ThreadPoolExecutor which takes submit_delay seconds in each submit call."""
+
+    def __init__(self, submit_delay=0.0005, **kwargs):
+        super().__init__(**kwargs)
+        self.submit_delay = submit_delay
+
+    def submit(self, *args, **kwargs):
+        time.sleep(self.submit_delay)
+        return super().submit(*args, **kwargs)
+
+
+def make_config(executors=4, submit_delay=0.0005):
+    return Config(executors=[SlowSubmitExecutor(label='slow_submit_{}'.format(i),
+                                                submit_delay=submit_delay,
+                                                max_threads=4)
+                             for i in range(executors)],
+                  strategy=None)
+
+
+def root():
+    time.sleep(0.5)
+    return 0
+
+
+def child(x, i):
+    return x + i
+
+
+def test_submit_contention(fanout=500):
+    dfk = parsl.dfk()
+    labels = [label for label in dfk.executors if label != 'data_manager']
+
+    roots = []
+    children = []
+    for label in labels:
+        r = python_app(root, executors=[label])()
+        roots.append(r)
+        child_app = python_app(child, executors=[label])
+        children.extend(child_app(r, i) for i in range(fanout))
+
+    [r.result() for r in roots]
+    start = time.time()
+    [c.result() for c in children]
+    delta = time.time() - start
+
+    print("Launched {} children over {} executors in {:=10.3f}ms: {:=10.1f} tasks/s".format(
+        len(children), len(labels), delta * 1000, len(children) / delta))
+    return delta
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-e", "--executors", default="4",
+                        help="Count of executors")
+    parser.add_argument("-c", "--count", default="500",
+                        help="Count of child apps per executor")
+    parser.add_argument("--delay", default="0.0005",
+                        help="Seconds taken by each executor submit call")
+    parser.add_argument("--global-lock", action='store_true',
+                        help="Share one submit lock between all executors")
+    parser.add_argument("-d", "--debug", action='store_true',
+                        help="Count of apps to launch")
+    args = parser.parse_args()
+
+    if args.debug:
+        parsl.set_stream_logger()
+
+    dfk = parsl.load(make_config(int(args.executors), float(args.delay)))
+    if args.global_lock:
+        lock = threading.Lock()
+        dfk.submitter_locks = {label: lock for label in dfk.submitter_locks}
+
+    test_submit_contention(int(args.count))
+    dfk.cleanup()
@@ -0,0 +1,55 @@
+import argparse
+
+import parsl
+from parsl.app.app import App
+from parsl.tests.configs.local_threads import config
+
+
+@App('python')
+def identity(x):
+    return x
+
+
+@App('python')
+def add_inputs(inputs=[]):
+    return sum(inputs)
+
+
+def test_fan_in(n=1000):
+    """Testing a reduce over many inputs, some of which are already complete
+    """
+    futs = [identity(i) for i in range(n)]
+    futs[0].result()
+
+    total = add_inputs(inputs=futs)
+    assert total.result() == sum(range(n))
+
+    task = parsl.dfk().tasks.get(total.tid)
+    if task is not None:
+        assert task.outstanding_deps == 0
+
+
+def test_fan_in_repeated_dependency(n=10):
+    """Testing that a future passed several times is counted off each time
+    """
+    fut = identity(1)
+    total = add_inputs(inputs=[fut] * n)
+    assert total.result() == n
+
+
+if __name__ == '__main__':
+    parsl.clear()
+    parsl.load(config)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-c", "--count", default="1000",
+                        help="Count of apps to launch")
+    parser.add_argument("-d", "--debug", action='store_true',
+                        help="Count of apps to launch")
+    args = parser.parse_args()
+
+    if args.debug:
+        parsl.set_stream_logger()
+
+    test_fan_in(int(args.count))
+    test_fan_in_repeated_dependency()
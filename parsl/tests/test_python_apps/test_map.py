@@ -0,0 +1,67 @@
+import argparse
+
+import parsl
+from parsl.app.app import App
+from parsl.tests.configs.local_threads import config
+
+
+@App('python')
+def multiply(x, y=1):
+    return x * y
+
+
+@App('python', cache=True)
+def increment(x):
+    return x + 1
+
+
+@App('bash')
+def echo(word, stdout=None):
+    return 'echo {0}'.format(word)
+
+
+def test_map(n=50):
+    """Testing that app.map gives the same results as calling the app in a loop
+    """
+    futs = multiply.map(range(n), range(n))
+    assert len(futs) == n
+    assert [f.result() for f in futs] == [i * i for i in range(n)]
+
+    futs = multiply.map(range(n), y=3)
+    assert [f.result() for f in futs] == [i * 3 for i in range(n)]
+
+
+def test_map_with_dependencies(n=20):
+    """Testing map over a mix of plain values and futures from earlier tasks
+    """
+    args = [multiply(i) if i % 2 else i for i in range(n)]
+    futs = increment.map(args)
+    assert [f.result() for f in futs] == [i + 1 for i in range(n)]
+
+    # Memoized results are returned for a repeated map
+    again = increment.map(range(n))
+    assert [f.result() for f in again] == [i + 1 for i in range(n)]
+
+
+def test_map_bash(n=5):
+    """Testing map on a bash app
+    """
+    futs = echo.map(range(n))
+    assert [f.result() for f in futs] == [0] * n
+
+
+if __name__ == '__main__':
+    parsl.clear()
+    parsl.load(config)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-d", "--debug", action='store_true',
+                        help="Count of apps to launch")
+    args = parser.parse_args()
+
+    if args.debug:
+        parsl.set_stream_logger()
+
+    test_map()
+    test_map_with_dependencies()
+    test_map_bash()
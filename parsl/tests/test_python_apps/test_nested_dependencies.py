@@ -0,0 +1,86 @@
+import argparse
+
+import pytest
+
+import parsl
+from parsl.app.app import App
+from parsl.config import Config
+from parsl.dataflow.error import DependencyError
+from parsl.executors.threads import ThreadPoolExecutor
+from parsl.tests.utils import get_rundir
+
+
+def local_config():
+    return Config(executors=[ThreadPoolExecutor(label='local_threads_nested')],
+                  run_dir=get_rundir(),
+                  nested_dependencies=True,
+                  strategy=None)
+
+
+@App('python')
+def double(x):
+    return x * 2
+
+
+@App('python')
+def fail():
+    raise ValueError("Deliberate failure")
+
+
+@App('python')
+def structure(items, mapping, pair=None, inputs=[]):
+    return items, mapping, pair, inputs
+
+
+@pytest.mark.local
+def test_nested_dependencies():
+    """Testing that futures nested in containers are waited on and replaced by their results
+    """
+    parsl.clear()
+    parsl.load(local_config())
+
+    items = [double(1), [double(2), 5], (double(3),)]
+    mapping = {'a': double(4), 'b': {'c': double(5)}, 'd': 'plain'}
+    pair = (7, double(6))
+
+    fut = structure(items, mapping, pair=pair, inputs=[double(7), [double(8)]])
+    assert fut.result() == ([2, [4, 5], (6,)],
+                            {'a': 8, 'b': {'c': 10}, 'd': 'plain'},
+                            (7, 12),
+                            [14, [16]])
+
+    # The containers the app was called with are left alone
+    assert isinstance(items[1][0], parsl.dataflow.futures.AppFuture)
+    assert isinstance(mapping['b']['c'], parsl.dataflow.futures.AppFuture)
+
+    parsl.dfk().cleanup()
+    parsl.clear()
+
+
+@pytest.mark.local
+def test_nested_dependency_failure():
+    """Testing that a failed future nested in a container fails the dependent task
+    """
+    parsl.clear()
+    parsl.load(local_config())
+
+    fut = structure([1, [fail()]], {})
+    with pytest.raises(DependencyError):
+        fut.result()
+
+    parsl.dfk().cleanup()
+    parsl.clear()
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-d", "--debug", action='store_true',
+                        help="Count of apps to launch")
+    args = parser.parse_args()
+
+    if args.debug:
+        parsl.set_stream_logger()
+
+    test_nested_dependencies()
+    test_nested_dependency_failure()
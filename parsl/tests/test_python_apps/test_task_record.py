@@ -0,0 +1,44 @@
+import argparse
+
+import parsl
+from parsl.app.app import App
+from parsl.dataflow.states import States
+from parsl.dataflow.taskrecord import TaskRecord
+from parsl.tests.configs.local_threads import config
+
+
+@App('python')
+def double(x):
+    return x * 2
+
+
+def test_task_record():
+    """Testing that the DFK keeps a TaskRecord for each task
+    """
+    fut = double(5)
+    assert fut.result() == 10
+
+    task = parsl.dfk().tasks[fut.tid]
+    assert isinstance(task, TaskRecord)
+    assert not hasattr(task, '__dict__'), "TaskRecord should not carry a per-instance dict"
+    assert task.status == States.done
+    assert task.func_name == 'double'
+
+    # Item access is kept for code written against the dict based task table
+    assert task['status'] is task.status
+    assert task.get('no_such_field') is None
+
+
+if __name__ == '__main__':
+    parsl.clear()
+    parsl.load(config)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-d", "--debug", action='store_true',
+                        help="Count of apps to launch")
+    args = parser.parse_args()
+
+    if args.debug:
+        parsl.set_stream_logger()
+
+    test_task_record()
@@ -0,0 +1,95 @@
+import argparse
+import os
+import pickle
+
+import pytest
+
+import parsl
+from parsl.app.app import App
+from parsl.config import Config
+from parsl.dataflow.states import States
+from parsl.executors.threads import ThreadPoolExecutor
+from parsl.tests.utils import get_rundir
+
+
+def local_config(**kwargs):
+    return Config(executors=[ThreadPoolExecutor(label='local_threads_retention')],
+                  run_dir=get_rundir(),
+                  strategy=None,
+                  **kwargs)
+
+
+@pytest.mark.local
+def test_task_retention(n=20, retention=5):
+    """Testing that finished task records are dropped beyond the retention limit
+    """
+    parsl.clear()
+    dfk = parsl.load(local_config(task_retention=retention))
+
+    @App('python')
+    def double(x):
+        return x * 2
+
+    @App('python')
+    def total(*args):
+        return sum(args)
+
+    futs = [double(i) for i in range(n)]
+    s = total(*futs)
+    assert s.result() == sum(2 * i for i in range(n))
+
+    # A future for a task whose record has already been dropped is still a valid input
+    assert double(futs[0]).result() == 0
+
+    assert len(dfk.tasks) <= retention, "Expected at most {} task records, got {}".format(retention, len(dfk.tasks))
+    assert sum(dfk.retired_task_counts.values()) + len(dfk.tasks) == dfk.task_count
+    assert dfk.retired_task_counts[States.done] > 0
+
+    for task in dfk.tasks.values():
+        assert task.args is None and task.kwargs is None and task.func is None
+
+    dfk.cleanup()
+    parsl.clear()
+
+
+@pytest.mark.local
+def test_task_retention_checkpoint(n=10):
+    """Testing that tasks dropped from the task table are still checkpointed at dfk exit
+    """
+    parsl.clear()
+    dfk = parsl.load(local_config(task_retention=0, checkpoint_mode='dfk_exit'))
+
+    @App('python', cache=True)
+    def double(x):
+        return x * 2
+
+    for i in range(n):
+        double(i).result()
+
+    assert len(dfk.tasks) == 0
+    dfk.cleanup()
+    parsl.clear()
+
+    with open(os.path.join(dfk.run_dir, 'checkpoint', 'tasks.pkl'), 'rb') as f:
+        entries = []
+        try:
+            while f:
+                entries.append(pickle.load(f))
+        except EOFError:
+            pass
+
+    assert len(entries) == n, "Expected {} checkpoint entries, got {}".format(n, len(entries))
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-d", "--debug", action='store_true',
+                        help="Count of apps to launch")
+    args = parser.parse_args()
+
+    if args.debug:
+        parsl.set_stream_logger()
+
+    test_task_retention()
+    test_task_retention_checkpoint()